@@ -14,7 +14,7 @@ Features:
 - Real-time serial communication with the Arduino
 
 Requirements:
-pip install fastapi uvicorn pyserial
+pip install -r requirements.txt
 
 Usage:
 1. Connect your Arduino/ESP8266 to a COM port
@@ -24,12 +24,20 @@ Usage:
 """
 
 from fastapi import FastAPI, HTTPException, Form
-from fastapi.responses import HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 import serial
-import json
+import asyncio
+import functools
+import itertools
+import queue
+import threading
 import time
-from typing import Optional
+import orjson
+from pathlib import Path
+from typing import ClassVar, Literal, Optional
+from pydantic import BaseModel, conint
 import uvicorn
 
 # ================================
@@ -37,496 +45,474 @@ import uvicorn
 # ================================
 SERIAL_PORT = "COM3"  # Change this to your Arduino's COM port
 BAUD_RATE = 115200
-TIMEOUT = 2  # Serial timeout in seconds
+TIMEOUT = 0.3  # Reply deadline in seconds, enforced by read_line()
+WRITE_TIMEOUT = 0.3  # Serial write timeout in seconds
+HELP_TIMEOUT = 2  # The help text is much longer than a command reply
+POLL_INTERVAL = max(0.001, 100 / BAUD_RATE)  # ~10 character times, 1 ms floor
+HELP_IDLE_TIMEOUT = 0.1  # Help output is complete after this much silence
+READ_CACHE_TTL = 0.5  # Seconds to reuse a sensor reading
+HELP_CACHE_TTL = 3600  # Seconds to reuse the help text
+STATIC_DIR = Path(__file__).parent / "static"  # Web interface files
+STATIC_CACHE_CONTROL = "public, max-age=3600, must-revalidate"
+
+# ================================
+# COMMAND MODELS
+# ================================
+# Request bodies are validated here so bad input is rejected with a 422
+# before it reaches the serial port. Ranges mirror the Arduino firmware.
+
+class RgbCmd(BaseModel):
+    action: ClassVar[str] = "rgb"  # Arduino "action" field
+    strip: conint(ge=1, le=2)
+    mode: Literal["single", "range", "all", "clear"]
+    pixel: Optional[conint(ge=0, le=77)] = None  # 78 LEDs per strip
+    start: Optional[conint(ge=0, le=77)] = None
+    end: Optional[conint(ge=0, le=77)] = None
+    r: Optional[conint(ge=0, le=255)] = None
+    g: Optional[conint(ge=0, le=255)] = None
+    b: Optional[conint(ge=0, le=255)] = None
+
+class LedCmd(BaseModel):
+    action: ClassVar[str] = "led"  # Arduino "action" field
+    mode: Literal["digital", "analog"]
+    state: Optional[bool] = None
+    value: Optional[conint(ge=0, le=255)] = None
+
+class RelayCmd(BaseModel):
+    action: ClassVar[str] = "relay"  # Arduino "action" field
+    relay: conint(ge=1, le=2)
+    state: bool
+
+class SensorCmd(BaseModel):
+    action: ClassVar[str] = "read"  # Arduino "action" field
+    sensor: Literal["lb", "rs", "temp"]
+    mode: Optional[Literal["analog", "digital"]] = None
+
+class ConfigCmd(BaseModel):
+    action: ClassVar[str] = "config"  # Arduino "action" field
+    setting: Literal["lb_threshold"]
+    value: conint(ge=0, le=1023)
 
 # ================================
 # SERIAL CONNECTION
 # ================================
-try:
-    arduino = serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=TIMEOUT)
-    time.sleep(2)  # Wait for Arduino to initialize
-    print(f"✅ Connected to Arduino on {SERIAL_PORT}")
-except Exception as e:
-    print(f"❌ Failed to connect to Arduino: {e}")
-    arduino = None
+# Opened in the background at startup; arduino_ready is set once that finishes
+arduino = None
+arduino_ready = asyncio.Event()
+
+# Bytes received but not yet returned by read_line()
+rx_buffer = bytearray()
+
+# Ids for matching replies to commands
+request_ids = itertools.count(1)
+
+# Jobs for the serial worker thread, the only thread that touches the port:
+# (function, arguments, future, event loop), or STOP_WORKER to end it
+serial_jobs = queue.Queue()
+STOP_WORKER = None
+
+# Cached responses: key -> (expiry time, response)
+response_cache = {}
+HELP_CACHE_KEY = b"help"
 
 # ================================
 # FASTAPI APP INITIALIZATION
 # ================================
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with a Cache-Control header
+
+    StaticFiles already sends ETag/Last-Modified and answers conditional
+    requests with 304, so browsers only revalidate the UI after max-age.
+    """
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
+        return response
+
 app = FastAPI(
     title="LED Controller API Tester",
     description="Web interface for testing Arduino LED Controller API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
+app.add_middleware(GZipMiddleware, minimum_size=500)
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+
+# ================================
+# COMMAND BUILDERS
+# ================================
+# Specialized encoders for the fixed command set, so the common commands
+# skip generic JSON serialization. Field order matches the Arduino help.
+
+def cmd_rgb_single(strip: int, pixel: int, r: int, g: int, b: int) -> bytes:
+    return f'{{"action":"rgb","strip":{strip},"mode":"single","pixel":{pixel},"r":{r},"g":{g},"b":{b}}}'.encode()
+
+def cmd_rgb_range(strip: int, start: int, end: int, r: int, g: int, b: int) -> bytes:
+    return f'{{"action":"rgb","strip":{strip},"mode":"range","start":{start},"end":{end},"r":{r},"g":{g},"b":{b}}}'.encode()
+
+def cmd_rgb_all(strip: int, r: int, g: int, b: int) -> bytes:
+    return f'{{"action":"rgb","strip":{strip},"mode":"all","r":{r},"g":{g},"b":{b}}}'.encode()
+
+def cmd_rgb_clear(strip: int) -> bytes:
+    return f'{{"action":"rgb","strip":{strip},"mode":"clear"}}'.encode()
+
+def cmd_led_digital(state: bool) -> bytes:
+    return b'{"action":"led","mode":"digital","state":true}' if state else b'{"action":"led","mode":"digital","state":false}'
+
+def cmd_led_analog(value: int) -> bytes:
+    return f'{{"action":"led","mode":"analog","value":{value}}}'.encode()
+
+def cmd_relay(relay: int, state: bool) -> bytes:
+    return f'{{"action":"relay","relay":{relay},"state":{"true" if state else "false"}}}'.encode()
+
+def cmd_lb_threshold(value: int) -> bytes:
+    return f'{{"action":"config","setting":"lb_threshold","value":{value}}}'.encode()
+
+# (model, mode or setting) -> (builder, argument fields)
+COMMAND_BUILDERS = {
+    (RgbCmd, "single"): (cmd_rgb_single, ("strip", "pixel", "r", "g", "b")),
+    (RgbCmd, "range"): (cmd_rgb_range, ("strip", "start", "end", "r", "g", "b")),
+    (RgbCmd, "all"): (cmd_rgb_all, ("strip", "r", "g", "b")),
+    (RgbCmd, "clear"): (cmd_rgb_clear, ("strip",)),
+    (LedCmd, "digital"): (cmd_led_digital, ("state",)),
+    (LedCmd, "analog"): (cmd_led_analog, ("value",)),
+    (RelayCmd, None): (cmd_relay, ("relay", "state")),
+    (ConfigCmd, "lb_threshold"): (cmd_lb_threshold, ("value",))
+}
+
+# (sensor, mode) -> complete read command
+READ_COMMANDS = {
+    ("lb", "analog"): b'{"action":"read","sensor":"lb","mode":"analog"}',
+    ("lb", "digital"): b'{"action":"read","sensor":"lb","mode":"digital"}',
+    ("rs", None): b'{"action":"read","sensor":"rs"}',
+    ("temp", None): b'{"action":"read","sensor":"temp"}'
+}
+
+def encode_command(cmd: BaseModel) -> bytes:
+    """Encode a validated command, using a specialized builder when it has every field"""
+    if isinstance(cmd, SensorCmd):
+        line = READ_COMMANDS.get((cmd.sensor, cmd.mode))
+    else:
+        choice = getattr(cmd, "mode", getattr(cmd, "setting", None))
+        builder, fields = COMMAND_BUILDERS[(type(cmd), choice)]
+        values = [getattr(cmd, field) for field in fields]
+        line = None if None in values else builder(*values)
+
+    # Optional fields left out: send exactly what was given
+    if line is None:
+        line = orjson.dumps({"action": cmd.action, **cmd.model_dump(exclude_none=True)})
+    return line
 
 # ================================
 # HELPER FUNCTIONS
 # ================================
 
-def send_command(command: str) -> dict:
+def ttl_cache(ttl: float):
+    """Memoize a no-argument function for ttl seconds"""
+    def decorator(func):
+        entry = []  # [expiry time, value] once populated
+
+        @functools.wraps(func)
+        def wrapper():
+            now = time.monotonic()
+            current = entry[:]  # Snapshot, in case cache_clear() runs meanwhile
+            if not current or current[0] <= now:
+                current = [now + ttl, func()]
+                entry[:] = current
+            return current[1]
+
+        wrapper.cache_clear = entry.clear
+        return wrapper
+    return decorator
+
+@ttl_cache(1.0)
+def connection_status() -> dict:
+    """Connection status, re-checked at most once per second"""
+    if not arduino_ready.is_set():
+        return {"status": "connecting", "port": SERIAL_PORT}
+    elif arduino and arduino.is_open:
+        return {"status": "connected", "port": SERIAL_PORT, "baud_rate": BAUD_RATE}
+    else:
+        return {"status": "disconnected", "message": "Arduino not connected"}
+
+def resolve_future(future: asyncio.Future, result=None, error=None):
+    """Complete a job's future unless the waiting request has gone away"""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+def serial_worker():
+    """Run queued serial jobs one at a time until STOP_WORKER arrives"""
+    while True:
+        job = serial_jobs.get()
+        if job is STOP_WORKER:
+            return
+        func, args, future, loop = job
+        try:
+            outcome = (func(*args), None)
+        except Exception as e:
+            outcome = (None, e)
+        try:
+            loop.call_soon_threadsafe(resolve_future, future, *outcome)
+        except RuntimeError:
+            pass  # Event loop already closed, nobody is waiting
+
+async def run_serial(func, *args):
+    """Run func on the serial worker thread and wait for its result"""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    serial_jobs.put((func, args, future, loop))
+    return await future
+
+def connect_arduino():
+    """Open the serial port and wait for the Arduino to initialize"""
+    global arduino
+    try:
+        arduino = serial.Serial(
+            SERIAL_PORT,
+            BAUD_RATE,
+            timeout=TIMEOUT,
+            write_timeout=WRITE_TIMEOUT
+        )
+        try:
+            arduino.set_low_latency_mode(True)  # 1 ms USB latency timer (Linux only)
+        except (AttributeError, NotImplementedError, OSError, ValueError):
+            pass
+        time.sleep(2)  # Wait for Arduino to initialize
+        rx_buffer.clear()
+        print(f"✅ Connected to Arduino on {SERIAL_PORT}")
+    except Exception as e:
+        print(f"❌ Failed to connect to Arduino: {e}")
+        arduino = None
+
+def close_arduino():
+    """Let pending output drain, then close the port"""
+    arduino.flush()
+    arduino.close()
+
+async def connect_arduino_async():
+    """Connect on the serial worker, then mark the Arduino as ready"""
+    await run_serial(connect_arduino)
+    arduino_ready.set()
+    connection_status.cache_clear()
+
+def require_ready():
+    """Reject requests immediately while the Arduino is still initializing"""
+    if not arduino_ready.is_set():
+        raise HTTPException(status_code=503, detail="Arduino is still initializing")
+
+def cache_get(key: bytes):
+    """Return a cached response, or None if missing or expired"""
+    entry = response_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def cache_put(key: bytes, value, ttl: float):
+    """Store a response for ttl seconds"""
+    response_cache[key] = (time.monotonic() + ttl, value)
+
+def read_line(deadline: float) -> bytes:
+    """Read the next non-empty line from the Arduino, or b'' on timeout"""
+    while True:
+        # Hand out complete lines already received, keeping the remainder
+        while b'\n' in rx_buffer:
+            line, _, rest = rx_buffer.partition(b'\n')
+            rx_buffer[:] = rest
+            if line.strip():
+                return bytes(line)
+
+        if time.monotonic() >= deadline:
+            return b''
+
+        # Pull in everything available in one call; sleep only when idle
+        waiting = arduino.in_waiting
+        if waiting:
+            rx_buffer.extend(arduino.read(waiting))
+        else:
+            time.sleep(POLL_INTERVAL)
+
+def send_command(command: bytes) -> dict:
     """Send command to Arduino and return response"""
     if arduino is None:
         return {"status": "error", "message": "Arduino not connected"}
     
     try:
-        # Clear any pending input before sending new command
-        arduino.reset_input_buffer()
-        
-        # Send command
-        arduino.write((command + '\n').encode())
-        arduino.flush()  # Ensure command is sent
-        
-        # Small delay to let Arduino process
-        time.sleep(0.05)
+        # Tag the command with an id; the Arduino echoes it in the reply
+        request_id = next(request_ids)
+        arduino.write(b'{"id":%d,' % request_id + command[1:] + b'\n')
         
-        # Read response with timeout
-        response = arduino.readline().decode().strip()
-        
-        if response:
+        # Read replies until ours arrives, discarding stale ones (bounded by TIMEOUT)
+        deadline = time.monotonic() + TIMEOUT
+        first_line = True
+        while True:
+            response = read_line(deadline).strip()
+            if not response:
+                return {"status": "error", "message": "No response from Arduino"}
+            is_first, first_line = first_line, False
             try:
-                return json.loads(response)
-            except json.JSONDecodeError:
-                return {"status": "error", "message": f"Invalid JSON response: {response}"}
-        else:
-            return {"status": "error", "message": "No response from Arduino"}
+                reply = orjson.loads(response)
+            except orjson.JSONDecodeError:
+                # Boot banner, leftover help text or a garbled line
+                print(f"⚠️ Discarded non-JSON line: {response.decode(errors='replace')}")
+                continue
+            if not isinstance(reply, dict):
+                continue
+            # Only the firmware's parse-error reply lacks an id; trust one
+            # of those only if it is the very first line after our write
+            reply_id = reply.pop("id", None)
+            if reply_id == request_id or (reply_id is None and is_first):
+                return reply
             
     except Exception as e:
         return {"status": "error", "message": f"Serial communication error: {str(e)}"}
 
+async def send_command_async(command: bytes, cache_ttl: float = 0, use_cache: bool = True) -> dict:
+    """Send command via the serial worker without blocking the event loop
+
+    A cache_ttl marks a read-only command whose reply may be reused;
+    use_cache=False skips the lookup but still stores the fresh reply.
+    """
+    if cache_ttl:
+        cached = cache_get(command) if use_cache else None
+        if cached is not None:
+            return cached
+    else:
+        # Any other command may change what the sensors report
+        for key in [key for key in response_cache if key != HELP_CACHE_KEY]:
+            del response_cache[key]
+
+    response = await run_serial(send_command, command)
+
+    if cache_ttl and response.get("status") == "success":
+        cache_put(command, response, cache_ttl)
+    return response
+
 def get_help() -> str:
     """Get help documentation from Arduino"""
     if arduino is None:
         return "Arduino not connected"
     
     try:
+        # Drop anything unread, e.g. a late reply to a timed-out command,
+        # so it does not end up in the (long-cached) help text
+        rx_buffer.clear()
+        arduino.reset_input_buffer()
         arduino.write(b'help\n')
-        time.sleep(0.1)
-        
-        help_text = ""
-        while arduino.in_waiting:
-            line = arduino.readline().decode().strip()
-            help_text += line + "\n"
-        
-        return help_text
+
+        # Collect everything available in bulk until the output goes quiet
+        buffer = bytearray()
+        deadline = time.monotonic() + HELP_TIMEOUT
+        last_data = time.monotonic()
+        while time.monotonic() < deadline:
+            waiting = arduino.in_waiting
+            if waiting:
+                buffer += arduino.read(waiting)
+                last_data = time.monotonic()
+            elif buffer and time.monotonic() - last_data > HELP_IDLE_TIMEOUT:
+                break
+            else:
+                time.sleep(POLL_INTERVAL)
+
+        lines = buffer.decode(errors="replace").splitlines()
+        return "".join(line.strip() + "\n" for line in lines)
     except Exception as e:
         return f"Error getting help: {e}"
 
+async def get_help_async(nocache: bool = False) -> str:
+    """Get help via the serial worker without blocking the event loop"""
+    if not nocache:
+        cached = cache_get(HELP_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+    help_text = await run_serial(get_help)
+
+    if arduino is not None and help_text and not help_text.startswith("Error"):
+        cache_put(HELP_CACHE_KEY, help_text, HELP_CACHE_TTL)
+    return help_text
+
+# ================================
+# STARTUP
+# ================================
+
+@app.on_event("startup")
+async def start_serial_connection():
+    """Connect to the Arduino without delaying server startup"""
+    worker = getattr(app.state, "serial_worker", None)
+    if worker is None or not worker.is_alive():
+        worker = threading.Thread(target=serial_worker, name="serial-worker", daemon=True)
+        worker.start()
+        app.state.serial_worker = worker
+    app.state.connect_task = asyncio.create_task(connect_arduino_async())
+
+@app.on_event("shutdown")
+async def close_serial_connection():
+    """Let pending output drain, close the port and stop the serial worker"""
+    if arduino is not None and arduino.is_open:
+        await run_serial(close_arduino)
+    serial_jobs.put(STOP_WORKER)
+    await asyncio.to_thread(app.state.serial_worker.join)
+    arduino_ready.clear()  # A restart has to reconnect first
+    connection_status.cache_clear()
+
 # ================================
 # WEB INTERFACE ROUTES
 # ================================
 
-@app.get("/", response_class=HTMLResponse)
+@app.get("/")
 async def main_page():
-    """Main web interface"""
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>LED Controller API Tester</title>
-        <meta charset="UTF-8">
-        <style>
-            body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
-            .container { max-width: 1200px; margin: 0 auto; }
-            .header { background: #2c3e50; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-            .section { background: white; padding: 20px; margin: 10px 0; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-            .grid { display: grid; grid-template-columns: 1fr 1fr; gap: 20px; }
-            .form-group { margin: 10px 0; }
-            label { display: block; margin-bottom: 5px; font-weight: bold; }
-            input, select, button { padding: 8px; margin: 2px; border: 1px solid #ddd; border-radius: 4px; }
-            button { background: #3498db; color: white; cursor: pointer; padding: 10px 20px; }
-            button:hover { background: #2980b9; }
-            .response { background: #ecf0f1; padding: 10px; border-radius: 4px; margin-top: 10px; font-family: monospace; }
-            .success { background: #d5f4e6; border-left: 4px solid #27ae60; }
-            .error { background: #fadbd8; border-left: 4px solid #e74c3c; }
-            .color-input { width: 60px; }
-            .inline { display: inline-block; margin-right: 10px; }
-            .help-section { background: #f8f9fa; border: 1px solid #dee2e6; }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🚦 LED Controller API Tester</h1>
-                <p>Web interface for testing Arduino LED Controller API functions</p>
-            </div>
-
-            <div class="grid">
-                <!-- RGB Strip Control -->
-                <div class="section">
-                    <h2>🌈 RGB Strip Control</h2>
-                    
-                    <h3>Single Pixel</h3>
-                    <form onsubmit="return testRgbSingle(event)">
-                        <div class="form-group">
-                            <label>Strip:</label>
-                            <select id="rgb_single_strip">
-                                <option value="1">1 (Ring-Top)</option>
-                                <option value="2">2 (Door)</option>
-                            </select>
-                        </div>
-                        <div class="form-group">
-                            <label>Pixel (0-77):</label>
-                            <input type="number" id="rgb_single_pixel" min="0" max="77" value="0">
-                        </div>
-                        <div class="form-group">
-                            <div class="inline">
-                                <label>R:</label>
-                                <input type="number" id="rgb_single_r" min="0" max="255" value="255" class="color-input">
-                            </div>
-                            <div class="inline">
-                                <label>G:</label>
-                                <input type="number" id="rgb_single_g" min="0" max="255" value="0" class="color-input">
-                            </div>
-                            <div class="inline">
-                                <label>B:</label>
-                                <input type="number" id="rgb_single_b" min="0" max="255" value="0" class="color-input">
-                            </div>
-                        </div>
-                        <button type="submit">Set Single Pixel</button>
-                    </form>
-
-                    <h3>Pixel Range</h3>
-                    <form onsubmit="return testRgbRange(event)">
-                        <div class="form-group">
-                            <label>Strip:</label>
-                            <select id="rgb_range_strip">
-                                <option value="1">1 (Ring-Top)</option>
-                                <option value="2">2 (Door)</option>
-                            </select>
-                        </div>
-                        <div class="form-group">
-                            <div class="inline">
-                                <label>Start:</label>
-                                <input type="number" id="rgb_range_start" min="0" max="77" value="0">
-                            </div>
-                            <div class="inline">
-                                <label>End:</label>
-                                <input type="number" id="rgb_range_end" min="0" max="77" value="9">
-                            </div>
-                        </div>
-                        <div class="form-group">
-                            <div class="inline">
-                                <label>R:</label>
-                                <input type="number" id="rgb_range_r" min="0" max="255" value="0" class="color-input">
-                            </div>
-                            <div class="inline">
-                                <label>G:</label>
-                                <input type="number" id="rgb_range_g" min="0" max="255" value="255" class="color-input">
-                            </div>
-                            <div class="inline">
-                                <label>B:</label>
-                                <input type="number" id="rgb_range_b" min="0" max="255" value="0" class="color-input">
-                            </div>
-                        </div>
-                        <button type="submit">Set Range</button>
-                    </form>
-
-                    <h3>All Pixels / Clear</h3>
-                    <form onsubmit="return testRgbAll(event)">
-                        <div class="form-group">
-                            <label>Strip:</label>
-                            <select id="rgb_all_strip">
-                                <option value="1">1 (Ring-Top)</option>
-                                <option value="2">2 (Door)</option>
-                            </select>
-                        </div>
-                        <div class="form-group">
-                            <div class="inline">
-                                <label>R:</label>
-                                <input type="number" id="rgb_all_r" min="0" max="255" value="0" class="color-input">
-                            </div>
-                            <div class="inline">
-                                <label>G:</label>
-                                <input type="number" id="rgb_all_g" min="0" max="255" value="0" class="color-input">
-                            </div>
-                            <div class="inline">
-                                <label>B:</label>
-                                <input type="number" id="rgb_all_b" min="0" max="255" value="255" class="color-input">
-                            </div>
-                        </div>
-                        <button type="submit">Set All Pixels</button>
-                        <button type="button" onclick="clearStrip()">Clear Strip</button>
-                    </form>
-
-                    <div id="rgb_response" class="response"></div>
-                </div>
-
-                <!-- LED Control -->
-                <div class="section">
-                    <h2>💡 LED Control</h2>
-                    
-                    <h3>Digital Control</h3>
-                    <button onclick="testLedDigital(true)">LED ON</button>
-                    <button onclick="testLedDigital(false)">LED OFF</button>
-
-                    <h3>Analog Control</h3>
-                    <form onsubmit="return testLedAnalog(event)">
-                        <div class="form-group">
-                            <label>Brightness (0-255):</label>
-                            <input type="range" id="led_brightness" min="0" max="255" value="128" 
-                                   oninput="document.getElementById('brightness_value').textContent = this.value">
-                            <span id="brightness_value">128</span>
-                        </div>
-                        <button type="submit">Set Brightness</button>
-                    </form>
-
-                    <div id="led_response" class="response"></div>
-                </div>
-            </div>
-
-            <div class="grid">
-                <!-- Relay Control -->
-                <div class="section">
-                    <h2>🔌 Relay Control</h2>
-                    
-                    <h3>Relay 1 (Intercom)</h3>
-                    <button onclick="testRelay(1, true)">Relay 1 ON</button>
-                    <button onclick="testRelay(1, false)">Relay 1 OFF</button>
-
-                    <h3>Relay 2 (General)</h3>
-                    <button onclick="testRelay(2, true)">Relay 2 ON</button>
-                    <button onclick="testRelay(2, false)">Relay 2 OFF</button>
-
-                    <div id="relay_response" class="response"></div>
-                </div>
-
-                <!-- Sensor Reading -->
-                <div class="section">
-                    <h2>📊 Sensor Reading</h2>
-                    
-                    <h3>LB Sensor (Paper Full)</h3>
-                    <button onclick="readSensor('lb', 'analog')">Read Analog Value</button>
-                    <button onclick="readSensor('lb', 'digital')">Read Digital Value</button>
-
-                    <h3>RS Sensor (Ticket Barrier)</h3>
-                    <button onclick="readSensor('rs')">Read State</button>
-
-                    <h3>Temperature Sensor (LM75)</h3>
-                    <button onclick="readSensor('temp')">Read Temperature</button>
-
-                    <div id="sensor_response" class="response"></div>
-                </div>
-            </div>
-
-            <!-- Configuration -->
-            <div class="section">
-                <h2>⚙️ Configuration</h2>
-                
-                <h3>LB Sensor Threshold</h3>
-                <form onsubmit="return setThreshold(event)">
-                    <div class="form-group">
-                        <label>Threshold (0-1023):</label>
-                        <input type="number" id="threshold_value" min="0" max="1023" value="512">
-                    </div>
-                    <button type="submit">Set Threshold</button>
-                </form>
-
-                <div id="config_response" class="response"></div>
-            </div>
-
-            <!-- Help Section -->
-            <div class="section help-section">
-                <h2>📖 API Documentation</h2>
-                <button onclick="showHelp()">Get Help from Arduino</button>
-                <pre id="help_content"></pre>
-            </div>
-        </div>
-
-        <script>
-            // Helper function to make API calls
-            async function callAPI(endpoint, data = {}) {
-                try {
-                    const response = await fetch(endpoint, {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify(data)
-                    });
-                    return await response.json();
-                } catch (error) {
-                    return { status: 'error', message: 'Network error: ' + error.message };
-                }
-            }
-
-            // Display response in UI
-            function displayResponse(elementId, response) {
-                const element = document.getElementById(elementId);
-                element.className = 'response ' + (response.status === 'success' ? 'success' : 'error');
-                element.textContent = JSON.stringify(response, null, 2);
-            }
-
-            // RGB Strip Functions
-            async function testRgbSingle(event) {
-                event.preventDefault();
-                const data = {
-                    action: 'rgb',
-                    strip: parseInt(document.getElementById('rgb_single_strip').value),
-                    mode: 'single',
-                    pixel: parseInt(document.getElementById('rgb_single_pixel').value),
-                    r: parseInt(document.getElementById('rgb_single_r').value),
-                    g: parseInt(document.getElementById('rgb_single_g').value),
-                    b: parseInt(document.getElementById('rgb_single_b').value)
-                };
-                const response = await callAPI('/test/rgb', data);
-                displayResponse('rgb_response', response);
-                return false;
-            }
-
-            async function testRgbRange(event) {
-                event.preventDefault();
-                const data = {
-                    action: 'rgb',
-                    strip: parseInt(document.getElementById('rgb_range_strip').value),
-                    mode: 'range',
-                    start: parseInt(document.getElementById('rgb_range_start').value),
-                    end: parseInt(document.getElementById('rgb_range_end').value),
-                    r: parseInt(document.getElementById('rgb_range_r').value),
-                    g: parseInt(document.getElementById('rgb_range_g').value),
-                    b: parseInt(document.getElementById('rgb_range_b').value)
-                };
-                const response = await callAPI('/test/rgb', data);
-                displayResponse('rgb_response', response);
-                return false;
-            }
-
-            async function testRgbAll(event) {
-                event.preventDefault();
-                const data = {
-                    action: 'rgb',
-                    strip: parseInt(document.getElementById('rgb_all_strip').value),
-                    mode: 'all',
-                    r: parseInt(document.getElementById('rgb_all_r').value),
-                    g: parseInt(document.getElementById('rgb_all_g').value),
-                    b: parseInt(document.getElementById('rgb_all_b').value)
-                };
-                const response = await callAPI('/test/rgb', data);
-                displayResponse('rgb_response', response);
-                return false;
-            }
-
-            async function clearStrip() {
-                const data = {
-                    action: 'rgb',
-                    strip: parseInt(document.getElementById('rgb_all_strip').value),
-                    mode: 'clear'
-                };
-                const response = await callAPI('/test/rgb', data);
-                displayResponse('rgb_response', response);
-            }
-
-            // LED Functions
-            async function testLedDigital(state) {
-                const data = {
-                    action: 'led',
-                    mode: 'digital',
-                    state: state
-                };
-                const response = await callAPI('/test/led', data);
-                displayResponse('led_response', response);
-            }
-
-            async function testLedAnalog(event) {
-                event.preventDefault();
-                const data = {
-                    action: 'led',
-                    mode: 'analog',
-                    value: parseInt(document.getElementById('led_brightness').value)
-                };
-                const response = await callAPI('/test/led', data);
-                displayResponse('led_response', response);
-                return false;
-            }
-
-            // Relay Functions
-            async function testRelay(relay, state) {
-                const data = {
-                    action: 'relay',
-                    relay: relay,
-                    state: state
-                };
-                const response = await callAPI('/test/relay', data);
-                displayResponse('relay_response', response);
-            }
-
-            // Sensor Functions
-            async function readSensor(sensor, mode = null) {
-                const data = {
-                    action: 'read',
-                    sensor: sensor
-                };
-                if (mode) {
-                    data.mode = mode;
-                }
-                const response = await callAPI('/test/sensor', data);
-                displayResponse('sensor_response', response);
-            }
-
-            // Configuration Functions
-            async function setThreshold(event) {
-                event.preventDefault();
-                const data = {
-                    action: 'config',
-                    setting: 'lb_threshold',
-                    value: parseInt(document.getElementById('threshold_value').value)
-                };
-                const response = await callAPI('/test/config', data);
-                displayResponse('config_response', response);
-                return false;
-            }
-
-            // Help Function
-            async function showHelp() {
-                const response = await callAPI('/help');
-                document.getElementById('help_content').textContent = response.help || response.message;
-            }
-        </script>
-    </body>
-    </html>
-    """
-    return html_content
+    """Main web interface (served from static/index.html)"""
+    return RedirectResponse(url="/static/index.html")
 
 # ================================
 # API TEST ENDPOINTS
 # ================================
 
+# One thin route per command group rather than a single /test/{action}
+# dispatcher: FastAPI only documents a typed body per route, so this keeps
+# each command's schema (and "Try it out") in /docs. All share
+# run_test_command, so encoding, caching and the serial hand-off live in one place.
+
+async def run_test_command(cmd: BaseModel, cache_ttl: float = 0, use_cache: bool = True) -> dict:
+    """Send a validated test command to the Arduino"""
+    require_ready()
+    return await send_command_async(encode_command(cmd), cache_ttl, use_cache)
+
 @app.post("/test/rgb")
-async def test_rgb(command: dict):
+async def test_rgb(cmd: RgbCmd):
     """Test RGB strip commands"""
-    command_str = json.dumps(command)
-    response = send_command(command_str)
-    return response
+    return await run_test_command(cmd)
 
 @app.post("/test/led")
-async def test_led(command: dict):
+async def test_led(cmd: LedCmd):
     """Test LED commands"""
-    command_str = json.dumps(command)
-    response = send_command(command_str)
-    return response
+    return await run_test_command(cmd)
 
 @app.post("/test/relay")
-async def test_relay(command: dict):
+async def test_relay(cmd: RelayCmd):
     """Test relay commands"""
-    command_str = json.dumps(command)
-    response = send_command(command_str)
-    return response
+    return await run_test_command(cmd)
 
 @app.post("/test/sensor")
-async def test_sensor(command: dict):
-    """Test sensor reading commands"""
-    command_str = json.dumps(command)
-    response = send_command(command_str)
-    return response
+async def test_sensor(cmd: SensorCmd, nocache: bool = False):
+    """Test sensor reading commands (cached briefly unless ?nocache=1)"""
+    return await run_test_command(cmd, READ_CACHE_TTL, use_cache=not nocache)
 
 @app.post("/test/config")
-async def test_config(command: dict):
+async def test_config(cmd: ConfigCmd):
     """Test configuration commands"""
-    command_str = json.dumps(command)
-    response = send_command(command_str)
-    return response
+    return await run_test_command(cmd)
 
 @app.post("/help")
-async def get_arduino_help():
-    """Get help documentation from Arduino"""
-    help_text = get_help()
+async def get_arduino_help(nocache: bool = False):
+    """Get help documentation from Arduino (cached unless ?nocache=1)"""
+    require_ready()
+    help_text = await get_help_async(nocache)
     return {"help": help_text}
 
 # ================================
@@ -536,14 +522,16 @@ async def get_arduino_help():
 @app.get("/status")
 async def get_status():
     """Get connection status"""
-    if arduino and arduino.is_open:
-        return {"status": "connected", "port": SERIAL_PORT, "baud_rate": BAUD_RATE}
-    else:
-        return {"status": "disconnected", "message": "Arduino not connected"}
+    return connection_status()
 
 @app.get("/info")
 async def get_info():
     """Get API information"""
+    return build_info()
+
+@functools.lru_cache(maxsize=None)
+def build_info() -> dict:
+    """Build the static API information once"""
     return {
         "title": "LED Controller API Tester",
         "version": "1.0.0",
@@ -569,4 +557,5 @@ if __name__ == "__main__":
     print(f"🌐 Web Interface: http://localhost:8000")
     print("📖 API Documentation: http://localhost:8000/docs")
     
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" picks uvloop where it is installed (it does not support Windows)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="httptools")
@@ -48,6 +48,8 @@ Adafruit_NeoPixel rgb2 = Adafruit_NeoPixel(NUM_LEDS_RGB_2, RGB2, NEO_GRB + NEO_K
 int lbThreshold = 512;    // Threshold for LB sensor digital mode (0-1023 range)
 String inputBuffer = "";  // Buffer to store incoming serial characters
 bool inputComplete = false;  // Flag to indicate when a complete command is received
+bool hasRequestId = false;   // Whether the current command carried an "id"
+long requestId = 0;          // "id" of the current command, echoed in responses
 
 // ================================
 // LM75 TEMPERATURE SENSOR (OPTIONAL)
@@ -79,6 +81,7 @@ void handleReadCommand(JsonDocument& doc);
 void handleConfigCommand(JsonDocument& doc);
 void sendSuccess(String message);
 void sendError(String message);
+void addRequestId(JsonDocument& response);
 void showHelp();
 float readLm75Temperature();
 bool lm75Available();
@@ -109,6 +112,7 @@ void processCommand(String command) {
   // Create JSON document with 1024 bytes capacity
   JsonDocument doc;
   DeserializationError error = deserializeJson(doc, command);
+  hasRequestId = false;  // Forget the previous command's id
   
   // Check if JSON parsing failed
   if (error) {
@@ -116,6 +120,12 @@ void processCommand(String command) {
     return;
   }
   
+  // Remember the optional request id so the response can echo it
+  if (doc["id"].is<long>()) {
+    hasRequestId = true;
+    requestId = doc["id"];
+  }
+  
   // Extract the action field from JSON
   String action = doc["action"];
   
@@ -351,6 +361,7 @@ void handleReadCommand(JsonDocument& doc) {
     response["celsius"] = t;
     response["resolution"] = "0.5";  // LM75A 9-bit => 0.5°C steps
     response["address"] = "0x48";
+    addRequestId(response);
     serializeJson(response, Serial);
     Serial.println();
     return;  // Do not continue to other branches
@@ -375,6 +386,7 @@ void handleReadCommand(JsonDocument& doc) {
       response["mode"] = "analog";
       response["value"] = value;           // Raw analog value
       response["range"] = "0-1023";        // Valid range information
+      addRequestId(response);
       serializeJson(response, Serial);
       Serial.println();
       
@@ -393,6 +405,7 @@ void handleReadCommand(JsonDocument& doc) {
       response["value"] = digital ? 1 : 0;  // Digital result (0 or 1)
       response["threshold"] = lbThreshold;  // Current threshold setting
       response["raw_value"] = value;        // Include raw value for reference
+      addRequestId(response);
       serializeJson(response, Serial);
       Serial.println();
       
@@ -414,6 +427,7 @@ void handleReadCommand(JsonDocument& doc) {
     response["status"] = "success";
     response["sensor"] = "rs";
     response["value"] = state ? 1 : 0;  // Convert boolean to 1/0
+    addRequestId(response);
     serializeJson(response, Serial);
     Serial.println();
     
@@ -468,6 +482,7 @@ void sendSuccess(String message) {
   JsonDocument response;
   response["status"] = "success";
   response["message"] = message;
+  addRequestId(response);
   serializeJson(response, Serial);  // Send JSON to serial
   Serial.println();                 // Add newline
 }
@@ -482,10 +497,24 @@ void sendError(String message) {
   JsonDocument response;
   response["status"] = "error";
   response["message"] = message;
+  addRequestId(response);
   serializeJson(response, Serial);  // Send JSON to serial
   Serial.println();                 // Add newline
 }
 
+/**
+ * REQUEST ID ECHO
+ * Copies the "id" of the current command into a response so the host
+ * can match replies to requests and discard stale ones
+ * 
+ * @param response Response document about to be sent
+ */
+void addRequestId(JsonDocument& response) {
+  if (hasRequestId) {
+    response["id"] = requestId;
+  }
+}
+
 /**
  * HELP DOCUMENTATION DISPLAY
  * Shows complete API documentation with examples for all available commands
@@ -557,6 +586,7 @@ void showHelp() {
   // RESPONSE FORMAT INFO
   // ================================
   Serial.println("All responses are in JSON format with 'status' field.");
+  Serial.println("An optional numeric 'id' in a command is echoed in its response.");
   Serial.println("Ready for commands...");
   Serial.println();
 }